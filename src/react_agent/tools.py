@@ -6,14 +6,171 @@ These tools are intended as free examples to get started. For production use,
 consider implementing more robust and specialized tools tailored to your needs.
 """
 
-from typing import Any, Callable, List, Optional, cast
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar, cast
 
+import httpx
+import orjson
+from cachetools import TTLCache
 from langchain_tavily import TavilySearch
 from langgraph.runtime import get_runtime
 
 from react_agent.context import Context
 
-import requests
+
+def _new_client() -> httpx.AsyncClient:
+    """Build the HTTP client shared by the weather tools.
+
+    Keep-alive connections are reused across calls (and held for a minute so
+    they survive between agent steps, sparing the DNS lookup and TLS handshake),
+    HTTP/2 lets concurrent requests share one connection, and connection failures
+    (`ConnectError`/`ConnectTimeout`; not read or pool timeouts) are retried.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+            ),
+            http2=True,
+            retries=2,
+        ),
+        timeout=httpx.Timeout(10.0),
+        headers={
+            "User-Agent": "react-agent/0.0.1 (+https://github.com/shr4git/react-agent)",
+            "Accept": "application/json",
+        },
+    )
+
+
+# Pooled connections are bound to the event loop that opened them, so the
+# shared client is created lazily and rebuilt whenever the running loop changes.
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _new_client()
+        _client_loop = loop
+    return _client
+
+
+async def _get_json(url: str, params: Optional[dict[str, Any]] = None) -> Any:
+    """GET a URL with the shared client and decode the JSON body with orjson."""
+    response = await _get_client().get(url, params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+class WeatherDataError(Exception):
+    """Raised when Open-Meteo answers without usable current weather data."""
+
+
+_T = TypeVar("_T")
+_Coordinates = tuple[float, float]
+
+# Geocoding results keyed by normalized city name. City coordinates
+# effectively never change, so entries are kept for a day.
+_GEO_CACHE: TTLCache[str, _Coordinates] = TTLCache(maxsize=10_000, ttl=24 * 60 * 60)
+
+# Current conditions keyed by coordinates rounded to ~100 m. Weather changes
+# on the order of minutes, so a short TTL keeps answers fresh.
+_WX_CACHE: TTLCache[_Coordinates, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=5 * 60)
+
+# Lookups currently in progress, so concurrent callers share one request.
+_INFLIGHT: dict[Hashable, asyncio.Future[Any]] = {}
+
+
+async def _single_flight(key: Hashable, fetch: Callable[[], Awaitable[_T]]) -> _T:
+    """Run `fetch` once per key, sharing its outcome with concurrent callers.
+
+    The fetch runs as its own task and every caller awaits it through
+    `asyncio.shield`, so cancelling one caller never cancels the others.
+    """
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return cast(_T, await asyncio.shield(task))
+
+
+async def _geocode(city: str) -> Optional[_Coordinates]:
+    """Return a city's coordinates from the Open-Meteo geocoding API.
+
+    Results are served from cache when possible.
+    """
+    key = city.strip().lower()
+    coords = _GEO_CACHE.get(key)
+    if coords is not None:
+        return coords
+
+    async def fetch() -> Optional[_Coordinates]:
+        geo_url = "https://geocoding-api.open-meteo.com/v1/search"
+        geo = await _get_json(geo_url, params={"name": city, "count": 1})
+        if "results" not in geo or not geo["results"]:
+            return None
+        coords = geo["results"][0]["latitude"], geo["results"][0]["longitude"]
+        _GEO_CACHE[key] = coords
+        return coords
+
+    return await _single_flight(("geocode", key), fetch)
+
+
+async def _current_weather(lat: float, lon: float) -> dict[str, Any]:
+    """Return Open-Meteo's current weather at the given coordinates."""
+    key = (round(float(lat), 3), round(float(lon), 3))
+    cached = _WX_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    async def fetch() -> dict[str, Any]:
+        weather_url = "https://api.open-meteo.com/v1/forecast"
+        weather_params: dict[str, Any] = {
+            "latitude": lat,
+            "longitude": lon,
+            "current_weather": "true",
+        }
+        data = await _get_json(weather_url, params=weather_params)
+        current = data.get("current_weather") or {}
+        if current.get("temperature") is None or current.get("windspeed") is None:
+            raise WeatherDataError("Open-Meteo returned no current weather data.")
+        _WX_CACHE[key] = current
+        return cast(dict[str, Any], current)
+
+    return await _single_flight(("weather", key), fetch)
+
+
+async def _weather_report(lat: float, lon: float) -> dict[str, Any]:
+    """Return the current weather at the given coordinates as a flat dict."""
+    current = await _current_weather(lat, lon)
+    return {
+        "lat": lat,
+        "lon": lon,
+        "temperature": current["temperature"],
+        "windspeed": current["windspeed"],
+        "weather_code": current.get("weathercode"),
+    }
+
+
+async def _fetch_weather(city: str) -> Optional[dict[str, Any]]:
+    """Geocode a city and return its current weather, or None if it is unknown.
+
+    This is the single lookup path behind every `get_weather*` tool, which only
+    differ in how they format the result.
+    """
+    coords = await _geocode(city)
+    if coords is None:
+        return None
+    return await _weather_report(*coords)
+
+
+# Tavily search tools keyed by `max_search_results`, reused across calls so the
+# underlying API client is only built once per setting.
+_TAVILY_CACHE: dict[int, TavilySearch] = {}
 
 
 async def search(query: str) -> Optional[dict[str, Any]]:
@@ -24,112 +181,69 @@ async def search(query: str) -> Optional[dict[str, Any]]:
     for answering questions about current events.
     """
     runtime = get_runtime(Context)
-    wrapped = TavilySearch(max_results=runtime.context.max_search_results)
+    n = runtime.context.max_search_results
+    wrapped = _TAVILY_CACHE.get(n)
+    if wrapped is None:
+        wrapped = _TAVILY_CACHE[n] = TavilySearch(max_results=n)
     return cast(dict[str, Any], await wrapped.ainvoke({"query": query}))
 
+
 async def get_weather(city: str) -> str:
     """Returns current weather in the specified city via Open‑Meteo APIs."""
     try:
-        # Geocode
-        geo_url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1"
-        geo_resp = await asyncio.to_thread(requests.get, geo_url, timeout=10)
-        geo_resp.raise_for_status()
-        geo = geo_resp.json()
-        if "results" not in geo or not geo["results"]:
-            return f"Sorry, could not find location info for city '{city}'."
-
-        lat = geo["results"][0]["latitude"]
-        lon = geo["results"][0]["longitude"]
-
-        # Weather
-        wx_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current_weather=true"
-        wx_resp = await asyncio.to_thread(requests.get, wx_url, timeout=10)
-        wx_resp.raise_for_status()
-        wx = wx_resp.json()
-        t = wx["current_weather"]["temperature"]
-        w = wx["current_weather"]["windspeed"]
-        return f"Current weather in {city}: temperature {t}°C, windspeed {w} km/h."
+        wx = await _fetch_weather(city)
     except Exception as e:
         return f"Error retrieving weather data: {e}"
+    if wx is None:
+        return f"Sorry, could not find location info for city '{city}'."
+    return f"Current weather in {city}: temperature {wx['temperature']}°C, windspeed {wx['windspeed']} km/h."
+
 
 async def get_weather_1(city: str) -> Optional[dict[str, Any]]:
-    """Get weather info for given city. """
-    geocode_url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        "q": city,
-        "format": "json",
-        "limit": 1,
-    }
+    """Get weather info for given city."""
     try:
-        geocode_response = requests.get(geocode_url, params=params)
-        geocode_response.raise_for_status()
-        locations = geocode_response.json()
-        if not locations:
-            return {"error": f"Can't find location for '{city}'."}
-        lat = locations[0]["lat"]
-        lon = locations[0]["lon"]
-
-        weather_url = "https://api.open-meteo.com/v1/forecast"
-        weather_params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current_weather": True,
-        }
-        weather_response = requests.get(weather_url, params=weather_params)
-        weather_response.raise_for_status()
-        data = weather_response.json()
-        current = data.get("current_weather", {})
-        temperature = current.get("temperature")
-        windspeed = current.get("windspeed")
-        weather_code = current.get("weathercode")
-
-        return {
-            "city": city.title(),
-            "temperature_celsius": temperature,
-            "windspeed_kmh": windspeed,
-            "weather_code": weather_code,
-        }
+        wx = await _fetch_weather(city)
     except Exception as e:
         return {"error": str(e)}
-
-async def get_weather_str(city: str) -> str:
-    """
-    Fetch current weather for a city using free geocoding + Open-Meteo API.
-    """
-    geocode_url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        "q": city,
-        "format": "json",
-        "limit": 1,
+    if wx is None:
+        return {"error": f"Can't find location for '{city}'."}
+    return {
+        "city": city.title(),
+        "temperature_celsius": wx["temperature"],
+        "windspeed_kmh": wx["windspeed"],
+        "weather_code": wx["weather_code"],
     }
-    geocode_response = requests.get(geocode_url, params=params)
 
-    if not geocode_response.ok or len(geocode_response.json()) == 0:
-        return f"Sorry, I couldn't find location for {city}."
 
-    data = geocode_response.json()[0]
-    lat = data["lat"]
-    lon = data["lon"]
-
-    weather_url = "https://api.open-meteo.com/v1/forecast"
-    weather_params = {
-        "latitude": lat,
-        "longitude": lon,
-        "current_weather": True,
-    }
-    weather_response = requests.get(weather_url, params=weather_params)
+async def get_weather_str(city: str) -> str:
+    """Fetch current weather for a city using free geocoding + Open-Meteo API."""
+    try:
+        coords = await _geocode(city)
+    except httpx.HTTPError:
+        coords = None
+    if coords is None:
+        return f"Sorry, I couldn't find location for {city}."
 
-    if not weather_response.ok:
+    try:
+        wx = await _weather_report(*coords)
+    except (httpx.HTTPError, WeatherDataError):
         return f"Sorry, I couldn't fetch weather data for {city}."
+    return f"The current temperature in {city.title()} is {wx['temperature']}°C with wind speed {wx['windspeed']} km/h (weather code: {wx['weather_code']})."
 
-    weather = weather_response.json().get("current_weather", {})
-    temp = weather.get("temperature")
-    windspeed = weather.get("windspeed")
-    weather_code = weather.get("weathercode")
 
-    return f"The current temperature in {city.title()} is {temp}°C with wind speed {windspeed} km/h (weather code: {weather_code})."
+async def get_weather_many(cities: list[str]) -> list[str]:
+    """Return current weather for several cities at once.
 
+    Prefer this over calling `get_weather` repeatedly: all cities are looked up
+    concurrently, so the total time is roughly that of a single lookup.
+    """
+    results = await asyncio.gather(
+        *(get_weather(city) for city in cities), return_exceptions=True
+    )
+    return [
+        r if isinstance(r, str) else f"Error retrieving weather data: {r}"
+        for r in results
+    ]
 
-TOOLS: List[Callable[..., Any]] = [search, get_weather]
-#TOOLS: List[Callable[..., Any]] = [search]
 
+TOOLS: tuple[Callable[..., Any], ...] = (search, get_weather, get_weather_many)
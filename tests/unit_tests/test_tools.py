@@ -0,0 +1,178 @@
+import asyncio
+from collections import Counter
+from typing import Any, Iterator, Optional
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+from react_agent import tools
+
+CITIES = {"tokyo": (35.69, 139.69), "são paulo": (-23.55, -46.64)}
+
+
+class FakeOpenMeteo:
+    """Stand-in for the Open-Meteo geocoding and forecast APIs."""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.requests: list[httpx.Request] = []
+        self.gate: Optional[asyncio.Event] = None
+        self.fail_geocode: set[str] = set()
+        self.forecast: dict[str, Any] = {
+            "current_weather": {"temperature": 21.5, "windspeed": 7.2, "weathercode": 1}
+        }
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.gate is not None:
+            await self.gate.wait()
+        else:
+            # Yield so concurrent callers overlap while the request is in flight.
+            await asyncio.sleep(0.01)
+        if request.url.host == "geocoding-api.open-meteo.com":
+            self.calls["geocode"] += 1
+            name = request.url.params["name"]
+            if name.lower() in self.fail_geocode:
+                return httpx.Response(500)
+            coords = CITIES.get(name.strip().lower())
+            if coords is None:
+                return httpx.Response(200, json={})
+            return httpx.Response(
+                200, json={"results": [{"latitude": coords[0], "longitude": coords[1]}]}
+            )
+        self.calls["forecast"] += 1
+        return httpx.Response(200, json=self.forecast)
+
+
+@pytest.fixture(autouse=True)
+def api(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeOpenMeteo]:
+    fake = FakeOpenMeteo()
+    monkeypatch.setattr(
+        tools,
+        "_new_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(fake)),
+    )
+    monkeypatch.setattr(tools, "_client", None)
+    monkeypatch.setattr(tools, "_GEO_CACHE", TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(tools, "_WX_CACHE", TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(tools, "_INFLIGHT", {})
+    yield fake
+
+
+TOKYO = "Current weather in Tokyo: temperature 21.5°C, windspeed 7.2 km/h."
+
+
+def test_concurrent_calls_for_same_city_share_one_request(api: FakeOpenMeteo) -> None:
+    async def run() -> list[str]:
+        return await asyncio.gather(*(tools.get_weather("Tokyo") for _ in range(10)))
+
+    assert asyncio.run(run()) == [TOKYO] * 10
+    assert api.calls == {"geocode": 1, "forecast": 1}
+
+
+def test_cancelling_one_caller_does_not_cancel_the_others(api: FakeOpenMeteo) -> None:
+    async def run() -> None:
+        api.gate = asyncio.Event()
+        first = asyncio.create_task(tools.get_weather("Tokyo"))
+        second = asyncio.create_task(tools.get_weather("tokyo "))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        api.gate.set()
+        assert (
+            await second
+            == "Current weather in tokyo : temperature 21.5°C, windspeed 7.2 km/h."
+        )
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(run())
+    assert api.calls == {"geocode": 1, "forecast": 1}
+
+
+def test_errors_reach_every_waiter(api: FakeOpenMeteo) -> None:
+    api.fail_geocode.add("tokyo")
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(tools.get_weather("Tokyo") for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert all(r.startswith("Error retrieving weather data: ") for r in results)
+    assert api.calls == {"geocode": 1}
+
+
+def test_cache_hits_skip_the_network(api: FakeOpenMeteo) -> None:
+    assert asyncio.run(tools.get_weather("Tokyo")) == TOKYO
+    assert asyncio.run(tools.get_weather(" TOKYO")).startswith(
+        "Current weather in  TOKYO"
+    )
+    assert api.calls == {"geocode": 1, "forecast": 1}
+
+
+def test_weather_is_refetched_after_ttl(
+    api: FakeOpenMeteo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [0.0]
+    monkeypatch.setattr(
+        tools, "_WX_CACHE", TTLCache(maxsize=100, ttl=300, timer=lambda: now[0])
+    )
+    asyncio.run(tools.get_weather("Tokyo"))
+    now[0] = 299
+    asyncio.run(tools.get_weather("Tokyo"))
+    assert api.calls == {"geocode": 1, "forecast": 1}
+    now[0] = 301
+    asyncio.run(tools.get_weather("Tokyo"))
+    assert api.calls == {"geocode": 1, "forecast": 2}
+
+
+def test_missing_current_weather_is_an_error_and_not_cached(
+    api: FakeOpenMeteo,
+) -> None:
+    api.forecast = {}
+    assert asyncio.run(tools.get_weather("Tokyo")).startswith(
+        "Error retrieving weather data: "
+    )
+    assert asyncio.run(tools.get_weather_str("Tokyo")) == (
+        "Sorry, I couldn't fetch weather data for Tokyo."
+    )
+    assert api.calls == {"geocode": 1, "forecast": 2}
+
+
+def test_get_weather_str_reports_geocoding_failures_as_unknown_location(
+    api: FakeOpenMeteo,
+) -> None:
+    api.fail_geocode.add("tokyo")
+    assert asyncio.run(tools.get_weather_str("Tokyo")) == (
+        "Sorry, I couldn't find location for Tokyo."
+    )
+
+
+def test_get_weather_many_keeps_order_and_maps_errors(api: FakeOpenMeteo) -> None:
+    api.fail_geocode.add("broken")
+    results = asyncio.run(tools.get_weather_many(["Tokyo", "Atlantis", "Broken"]))
+    assert results[0] == TOKYO
+    assert results[1] == "Sorry, could not find location info for city 'Atlantis'."
+    assert results[2].startswith("Error retrieving weather data: ")
+
+
+def test_get_weather_many_converts_raised_exceptions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_get_weather(city: str) -> str:
+        if city == "Boom":
+            raise RuntimeError("boom")
+        return city
+
+    monkeypatch.setattr(tools, "get_weather", fake_get_weather)
+    results = asyncio.run(tools.get_weather_many(["A", "Boom", "B"]))
+    assert results == ["A", "Error retrieving weather data: boom", "B"]
+
+
+def test_city_name_is_sent_as_query_params(api: FakeOpenMeteo) -> None:
+    assert asyncio.run(tools.get_weather("São Paulo")).startswith(
+        "Current weather in São Paulo: "
+    )
+    geocode = api.requests[0]
+    assert geocode.url.params["name"] == "São Paulo"
+    assert geocode.url.params["count"] == "1"
+    assert b"name=S%C3%A3o+Paulo" in geocode.url.query